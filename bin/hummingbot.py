@@ -23,7 +23,7 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import install_event_loop_policy, safe_gather
 
 
 class UIStartListener(EventListener):
@@ -83,6 +83,7 @@ def main():
     chdir_to_data_directory()
     secrets_manager_cls = ETHKeyFileSecretManger
 
+    install_event_loop_policy()
     try:
         ev_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
     except RuntimeError:
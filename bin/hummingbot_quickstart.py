@@ -31,7 +31,7 @@ from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import install_event_loop_policy, safe_gather
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -275,6 +275,7 @@ def main():
     else:
         secrets_manager = secrets_manager_cls(args.config_password)
 
+    install_event_loop_policy()
     try:
         ev_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
     except RuntimeError:
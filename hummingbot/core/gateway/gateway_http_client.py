@@ -127,16 +127,16 @@ class GatewayHttpClient:
                     password=password
                 )
 
-                # Create connector with explicit timeout settings
+                # Keep connections alive so that concurrent quote requests don't each pay for a new TLS handshake
                 conn = aiohttp.TCPConnector(
                     ssl=ssl_ctx,
-                    force_close=True,  # Don't reuse connections for debugging
                     limit=100,
                     limit_per_host=30,
+                    keepalive_timeout=60,
                 )
             else:
                 # Non-SSL connection for development
-                conn = aiohttp.TCPConnector(ssl=False)
+                conn = aiohttp.TCPConnector(ssl=False, keepalive_timeout=60)
             cls._shared_client = aiohttp.ClientSession(connector=conn)
         return cls._shared_client
 
@@ -1,5 +1,8 @@
 from decimal import Decimal
-from hummingbot.client.config.config_data_types import ClientFieldData
+from functools import cached_property
+
+from pydantic import Field
+
 from hummingbot.strategy.v2.data_types import ConnectorPair
 from hummingbot.strategy.v2.strategies.amm_arb_v2.main import AmmArbV2Config
 
@@ -13,36 +16,64 @@ class AmmArbV2Config(AmmArbV2Config):
     trading_pair_2: str = "WBTC-WETH"
 
     # --- Dynamic Order Sizing Parameters ---
-    min_order_amount: Decimal = ClientFieldData(
+    min_order_amount: Decimal = Field(
         default=Decimal("0.01"),
-        prompt=lambda: "What is the minimum order amount to consider for an arbitrage trade?",
-        prompt_on_new=True
+        json_schema_extra={
+            "prompt": "What is the minimum order amount to consider for an arbitrage trade?",
+            "prompt_on_new": True,
+        },
     )
-    max_order_amount: Decimal = ClientFieldData(
+    max_order_amount: Decimal = Field(
         default=Decimal("1.0"),
-        prompt=lambda: "What is the maximum order amount to consider for an arbitrage trade?",
-        prompt_on_new=True
+        json_schema_extra={
+            "prompt": "What is the maximum order amount to consider for an arbitrage trade?",
+            "prompt_on_new": True,
+        },
     )
-    min_profitability: Decimal = ClientFieldData(
+    min_profitability: Decimal = Field(
         default=Decimal("0.005"),
-        prompt=lambda: "What is the minimum profitability (as a decimal, e.g., 0.005 for 0.5%)?",
-        prompt_on_new=True
+        json_schema_extra={
+            "prompt": "What is the minimum profitability (as a decimal, e.g., 0.005 for 0.5%)?",
+            "prompt_on_new": True,
+        },
     )
 
     # --- Slippage Buffers ---
-    market_1_slippage_buffer: Decimal = ClientFieldData(
+    market_1_slippage_buffer: Decimal = Field(
         default=Decimal("0.01"),
-        prompt=lambda: "Enter the slippage buffer for the first market (e.g., 0.01 for 1%):",
-        prompt_on_new=False
+        json_schema_extra={
+            "prompt": "Enter the slippage buffer for the first market (e.g., 0.01 for 1%):",
+            "prompt_on_new": False,
+        },
     )
-    market_2_slippage_buffer: Decimal = ClientFieldData(
+    market_2_slippage_buffer: Decimal = Field(
         default=Decimal("0.01"),
-        prompt=lambda: "Enter the slippage buffer for the second market (e.g., 0.01 for 1%):",
-        prompt_on_new=False
+        json_schema_extra={
+            "prompt": "Enter the slippage buffer for the second market (e.g., 0.01 for 1%):",
+            "prompt_on_new": False,
+        },
+    )
+
+    # --- Quote Caching ---
+    proposal_cache_ttl_ms: int = Field(
+        default=500,
+        json_schema_extra={
+            "prompt": "How long (in milliseconds) can an arbitrage quote be reused before it is refreshed?",
+            "prompt_on_new": False,
+        },
+    )
+    book_staleness_ms: int = Field(
+        default=200,
+        json_schema_extra={
+            "prompt": "For how long (in milliseconds) can the last search result be reused while the order books "
+                      "are unchanged?",
+            "prompt_on_new": False,
+        },
     )
 
-    @property
+    @cached_property
     def markets(self) -> dict[str, ConnectorPair]:
+        # Connectors and trading pairs are fixed for the lifetime of a running strategy, so build these once
         return {
             "market_1": ConnectorPair(connector=self.connector_1, trading_pair=self.trading_pair_1),
             "market_2": ConnectorPair(connector=self.connector_2, trading_pair=self.trading_pair_2),
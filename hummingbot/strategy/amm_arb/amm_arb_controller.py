@@ -1,19 +1,56 @@
 import asyncio
-import pandas as pd
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Awaitable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
 
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.client.performance import PerformanceMetrics
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import ConnectorType, get_connector_type
+from hummingbot.connector.gateway.gateway_lp import AMMPoolInfo, GatewayLp
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.events import BuyOrderCompletedEvent, SellOrderCompletedEvent
-from hummingbot.strategy.amm_arb.data_types import ArbProposal, ArbProposalSide
-from hummingbot.strategy.amm_arb.utils import create_arb_proposals
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    SellOrderCompletedEvent,
+)
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.strategy.amm_arb.data_types import ArbProposal, ArbProposalSide, TokenAmount
+from hummingbot.strategy.amm_arb.utils import (
+    CpmmPoolState,
+    CpmmReserves,
+    ProposalCache,
+    bracket_maximum,
+    cpmm_optimal_size,
+    create_arb_proposals,
+    estimate_cpmm_profits,
+    get_market_slot,
+    golden_section_search,
+    orient_pool_reserves,
+    spread_covers_fees,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.v2.controllers.base_controller import BaseController
 from hummingbot.strategy.v2.models.base import RunnableStatus
 from hummingbot.strategy.v2.models.executor_info import ExecutorInfo
 
+s_decimal_nan = Decimal("NaN")
+s_decimal_neg_one = Decimal("-1")
+ORDER_AMOUNT_DECIMALS = 8
+ORDER_AMOUNT_QUANTUM = Decimal(1).scaleb(-ORDER_AMOUNT_DECIMALS)
+MAX_CONCURRENT_PROBES = 8
+CPMM_ESTIMATE_STEPS = 64
+CPMM_SEED_WINDOW = 1.5
+
+
 class AmmArbV2Controller(BaseController):
     """
     Controller for the AMM Arbitrage V2 strategy with dynamic order sizing.
@@ -23,100 +60,410 @@ class AmmArbV2Controller(BaseController):
         super().__init__(config, *args, **kwargs)
         self.config = config
         self.last_proposal: Optional[ArbProposal] = None
+        # Config values read on every probe, resolved once. The search works on integer order amounts.
+        self._min_order_units = int(config.min_order_amount.scaleb(ORDER_AMOUNT_DECIMALS))
+        self._max_order_units = int(config.max_order_amount.scaleb(ORDER_AMOUNT_DECIMALS))
+        self._min_profitability: Decimal = config.min_profitability
+        self._book_staleness: float = config.book_staleness_ms / 1000
+        # Top of book of both markets at the last search, with its timestamp and result
+        self._last_fingerprint: Optional[Tuple[Decimal, ...]] = None
+        self._last_fingerprint_ts: float = 0
+        self._last_opportunity: Optional[Tuple[ArbProposal, Decimal]] = None
+        # Bounds the number of in-flight quote requests to stay clear of DEX RPC rate limits
+        self._probe_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        self.last_profit_pct: Optional[Decimal] = None
+        self._proposal_cache = ProposalCache(ttl=config.proposal_cache_ttl_ms / 1000)
+        self._skipped_searches = 0
+        # Best (bid, ask) per (connector name, trading pair), pushed by order book trade events
+        self._price_cache: Dict[Tuple[str, str], Tuple[Decimal, Decimal]] = {}
+        self._order_book_trade_forwarder = SourceInfoEventForwarder(self._process_public_trade)
+        self._subscribed_to_order_book_trade_events = False
+        # Order books listened to for public trades, with the market each of them belongs to
+        self._trade_event_order_books: List[Tuple[PubSub, MarketTradingPairTuple]] = []
+        # Taker fees keyed by market slot, the live connector names can differ from the configured ones
+        self._taker_fee_pcts: Dict[str, Decimal] = {
+            slot: TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=name).taker_percent_fee_decimal
+            for slot, name in (("market_1", config.connector_1), ("market_2", config.connector_2))
+        }
+        # Slippage buffers and the price adjustments derived from them, keyed by market slot
+        self._slippage_buffers: Dict[str, Decimal] = {
+            "market_1": config.market_1_slippage_buffer,
+            "market_2": config.market_2_slippage_buffer,
+        }
+        self._buy_price_adjustments: Dict[str, Decimal] = {
+            slot: Decimal("1") + buffer for slot, buffer in self._slippage_buffers.items()
+        }
+        self._sell_price_adjustments: Dict[str, Decimal] = {
+            slot: Decimal("1") - buffer for slot, buffer in self._slippage_buffers.items()
+        }
 
     async def determine_actions(self) -> List[ExecutorInfo]:
         """
         Finds the optimal arbitrage opportunity and, if profitable, creates executors to execute the trades.
         """
+        if not self._subscribed_to_order_book_trade_events:
+            self._subscribe_to_order_book_trade_events()
+        self._proposal_cache.evict_stale(self.market_data_provider.time())
         optimal_opportunity = await self.find_optimal_arb_opportunity()
         if not optimal_opportunity:
             return []
 
         proposal, profit_pct = optimal_opportunity
         self.last_proposal = proposal
+        self.last_profit_pct = profit_pct
 
-        if profit_pct >= self.config.min_profitability:
+        if profit_pct >= self._min_profitability:
             self.log_with_clock(
                 f"Found profitable opportunity ({profit_pct:.2%}). "
                 f"Executing trade with size {proposal.first_side.amount}."
             )
-            return self.create_executors(proposal)
+            executors = self.create_executors(proposal)
+            # The trade moves the markets, the proposal must not be executed again from the cache
+            self._invalidate_search_results()
+            return executors
         return []
 
     async def find_optimal_arb_opportunity(self) -> Optional[Tuple[ArbProposal, Decimal]]:
         """
         Analyzes markets to find the trade size that maximizes profit percentage.
         Returns the best proposal and its profitability, or None if no opportunity exists.
+        The previous result is reused when the top of book is unchanged and was checked less than
+        book_staleness_ms ago, since the search would come to the same conclusion.
         """
         market_1 = self.connectors["market_1"]
         market_2 = self.connectors["market_2"]
 
-        # Check for opportunities: Buy on 1, Sell on 2 OR Buy on 2, Sell on 1
-        opp1 = await self.find_best_size_for_direction(buy_market=market_1, sell_market=market_2)
-        opp2 = await self.find_best_size_for_direction(buy_market=market_2, sell_market=market_1)
+        fingerprint = (*self._refresh_price(market_1), *self._refresh_price(market_2))
+        now = self.market_data_provider.time()
+        if fingerprint == self._last_fingerprint and now - self._last_fingerprint_ts < self._book_staleness:
+            return self._last_opportunity
+
+        # Pool reserves are shared by both directions, so they are fetched once per search
+        pool_reserves = await self._fetch_cpmm_reserves()
+
+        # Check for opportunities: Buy on 1, Sell on 2 OR Buy on 2, Sell on 1.
+        # Both directions are independent so they are searched concurrently.
+        opp1, opp2 = await safe_gather(
+            self.find_best_size_for_direction(buy_market=market_1, sell_market=market_2, pool_reserves=pool_reserves),
+            self.find_best_size_for_direction(buy_market=market_2, sell_market=market_1, pool_reserves=pool_reserves),
+        )
 
         # Return the opportunity with the highest profitability
         if opp1 and opp2:
-            return opp1 if opp1[1] > opp2[1] else opp2
-        return opp1 or opp2
+            opportunity = opp1 if opp1[1] > opp2[1] else opp2
+        else:
+            opportunity = opp1 or opp2
+        self._last_fingerprint, self._last_fingerprint_ts, self._last_opportunity = fingerprint, now, opportunity
+        return opportunity
+
+    def _invalidate_search_results(self):
+        """
+        Forgets the last search result and the cached quotes, so the next search quotes the markets again.
+        """
+        self._last_fingerprint = None
+        self._last_opportunity = None
+        self._proposal_cache.clear()
 
-    async def find_best_size_for_direction(self, buy_market: MarketTradingPairTuple, sell_market: MarketTradingPairTuple) -> Optional[Tuple[ArbProposal, Decimal]]:
+    async def find_best_size_for_direction(self,
+                                           buy_market: MarketTradingPairTuple,
+                                           sell_market: MarketTradingPairTuple,
+                                           pool_reserves: Optional[Dict[str, CpmmReserves]] = None) -> Optional[Tuple[ArbProposal, Decimal]]:
         """
-        Iterates through trade sizes to find the most profitable one for a given trade direction.
+        Finds the most profitable size for a given trade direction. Profitability is unimodal in the order amount (it
+        rises while slippage stays below the edge and falls once price impact dominates), so the optimum is refined
+        with a golden-section search, see golden_section_search. When one side is a constant product pool, its
+        profitability is estimated analytically for many sizes and the search runs in a window around the best
+        estimate. Otherwise, or when no size is estimated to be profitable, a coarse grid over the order amount range
+        is quoted concurrently to bracket the optimum.
         """
-        best_profit_pct = Decimal("-1")
-        best_proposal = None
-        
-        # Iterate from min to max amount in steps to find the optimal size
-        # A more advanced implementation might use a more sophisticated optimization algorithm
-        num_steps = 20  # Number of sizes to check
-        step_size = (self.config.max_order_amount - self.config.min_order_amount) / (num_steps - 1)
+        if not self._quick_spread_check(buy_market, sell_market, pool_reserves or {}):
+            self._skipped_searches += 1
+            self.logger().debug(f"Top of book spread from {buy_market.market.name} to {sell_market.market.name} "
+                                f"cannot cover fees, skipping size search ({self._skipped_searches} skipped so far).")
+            return None
+
+        # The search runs on integer order amounts in ORDER_AMOUNT_QUANTUM units and compares float profits, only
+        # the probed amounts are converted back to Decimal
+        evaluations: Dict[int, Tuple[Optional[ArbProposal], Decimal]] = {}
+
+        def evaluate(amount: int) -> Awaitable[float]:
+            return self._eval_size(amount, buy_market, sell_market, evaluations)
+
+        pool_state = self._get_cpmm_pool_state(buy_market, sell_market, pool_reserves or {})
+        bracket = self._cpmm_search_window(pool_state) if pool_state is not None else None
+        if bracket is None:
+            # The estimate leaves out the connector fee schema and the external book depth, so it does not get to
+            # rule out a direction on its own, the optimum is bracketed with quotes instead
+            bracket = await bracket_maximum(evaluate, self._min_order_units, self._max_order_units)
+        lower, upper = bracket
+        if lower < upper:
+            await golden_section_search(evaluate, lower, upper)
+        else:
+            await evaluate(lower)
+
+        best_proposal, best_profit_pct = max(evaluations.values(), key=lambda evaluation: evaluation[1])
+        if best_proposal and best_profit_pct > 0:
+            return best_proposal, best_profit_pct
+        return None
 
-        for i in range(num_steps):
-            order_amount = self.config.min_order_amount + i * step_size
+    def _cpmm_search_window(self, pool_state: CpmmPoolState) -> Optional[Tuple[int, int]]:
+        """
+        Returns the order amount range to search against a constant product pool, in ORDER_AMOUNT_QUANTUM units. The
+        profitability is estimated for sizes up to the closed-form optimal size, past which it only decreases, and
+        the window spans CPMM_SEED_WINDOW around the best estimate, clipped to the configured range.
+        Returns None when no size is estimated to be profitable.
+        """
+        optimal_size = cpmm_optimal_size(pool_state)
+        if optimal_size is None:
+            return None
+        max_amount = min(self._max_order_units, int(optimal_size / float(ORDER_AMOUNT_QUANTUM)))
+        amounts = np.linspace(self._min_order_units, max(self._min_order_units, max_amount), CPMM_ESTIMATE_STEPS)
+        estimated_profits = estimate_cpmm_profits(pool_state, amounts * float(ORDER_AMOUNT_QUANTUM))
+        best_index = int(np.argmax(estimated_profits))
+        if estimated_profits[best_index] <= 0:
+            return None
+        seed = float(amounts[best_index])
+        return (max(self._min_order_units, int(seed / CPMM_SEED_WINDOW)),
+                min(self._max_order_units, int(seed * CPMM_SEED_WINDOW)))
+
+    def _quick_spread_check(self,
+                            buy_market: MarketTradingPairTuple,
+                            sell_market: MarketTradingPairTuple,
+                            pool_reserves: Dict[str, CpmmReserves]) -> bool:
+        """
+        Returns False when the top of book spread between the two markets cannot cover the taker fees plus the
+        minimum profitability, see spread_covers_fees.
+        """
+        _, buy_price = self._top_of_book(buy_market, pool_reserves)
+        sell_price, _ = self._top_of_book(sell_market, pool_reserves)
+        quote_rate = RateOracle.get_instance().get_pair_rate(
+            f"{sell_market.quote_asset}-{buy_market.quote_asset}"
+        )
+        fee_pct = (self._taker_fee_pcts[get_market_slot(buy_market, self.connectors)]
+                   + self._taker_fee_pcts[get_market_slot(sell_market, self.connectors)])
+        return spread_covers_fees(buy_price, sell_price, quote_rate, fee_pct, self._min_profitability)
+
+    def _top_of_book(self,
+                     market_info: MarketTradingPairTuple,
+                     pool_reserves: Dict[str, CpmmReserves]) -> Tuple[Decimal, Decimal]:
+        """
+        Returns the best bid and ask of the market. Constant product pools have no order book, their spot price stands
+        for both instead. It leaves out the pool fee and price impact, so the spread is only ever overestimated.
+        """
+        reserves = pool_reserves.get(get_market_slot(market_info, self.connectors))
+        if reserves is not None:
+            return reserves.spot_price, reserves.spot_price
+        return self._refresh_price(market_info)
+
+    async def _fetch_cpmm_reserves(self) -> Dict[str, CpmmReserves]:
+        """
+        Returns the reserves of the markets that are constant product pools exposing them, keyed by market slot.
+        Pools whose tokens cannot be matched to the trading pair are left out, so they are searched with quotes.
+        """
+        pool_markets = {slot: market_info for slot, market_info in self.connectors.items()
+                        if self._is_cpmm_market(market_info)}
+        pool_infos = await safe_gather(*[self._fetch_pool_info(market_info) for market_info in pool_markets.values()])
+        pool_reserves = {}
+        for (slot, market_info), pool_info in zip(pool_markets.items(), pool_infos):
+            if not isinstance(pool_info, AMMPoolInfo):
+                continue
+            reserves = orient_pool_reserves(
+                pool_info,
+                self._token_symbol(market_info, pool_info.base_token_address),
+                self._token_symbol(market_info, pool_info.quote_token_address),
+                market_info.base_asset,
+                market_info.quote_asset,
+            )
+            if reserves is None:
+                self.logger().debug(f"The tokens of the {market_info.trading_pair} pool on {market_info.market.name} "
+                                    f"could not be matched to the trading pair, sizing with quotes instead.")
+                continue
+            pool_reserves[slot] = reserves
+        return pool_reserves
+
+    async def _fetch_pool_info(self, market_info: MarketTradingPairTuple):
+        async with self._probe_semaphore:
+            return await market_info.market.get_pool_info(market_info.trading_pair)
+
+    @staticmethod
+    def _token_symbol(market_info: MarketTradingPairTuple, token_address: str) -> Optional[str]:
+        token_info = market_info.market.get_token_by_address(token_address)
+        return token_info.get("symbol") if token_info else None
+
+    def _get_cpmm_pool_state(self,
+                             buy_market: MarketTradingPairTuple,
+                             sell_market: MarketTradingPairTuple,
+                             pool_reserves: Dict[str, CpmmReserves]) -> Optional[CpmmPoolState]:
+        """
+        Returns the state of the constant product pool traded in this direction, against the other market's top of
+        book. Prices and the network fees of both markets are converted to the pool's quote asset.
+        Returns None when neither market is a CPMM pool, or when a price or conversion rate is unavailable.
+        """
+        buy_slot = get_market_slot(buy_market, self.connectors)
+        sell_slot = get_market_slot(sell_market, self.connectors)
+        if buy_slot in pool_reserves:
+            pool_market, external_market, pool_is_buy, reserves = buy_market, sell_market, True, pool_reserves[buy_slot]
+        elif sell_slot in pool_reserves:
+            pool_market, external_market, pool_is_buy, reserves = sell_market, buy_market, False, pool_reserves[sell_slot]
+        else:
+            return None
+
+        best_bid, best_ask = self._refresh_price(external_market)
+        external_price = best_bid if pool_is_buy else best_ask
+        rate_oracle = RateOracle.get_instance()
+        quote_rate = rate_oracle.get_pair_rate(f"{external_market.quote_asset}-{pool_market.quote_asset}")
+        if not quote_rate or external_price.is_nan() or external_price <= 0:
+            return None
+
+        flat_fee = Decimal("0")
+        for fee in self._extra_flat_fees(buy_market) + self._extra_flat_fees(sell_market):
+            fee_rate = (Decimal("1") if fee.token == pool_market.quote_asset
+                        else rate_oracle.get_pair_rate(f"{fee.token}-{pool_market.quote_asset}"))
+            if not fee_rate:
+                return None
+            flat_fee += fee.amount * fee_rate
+
+        external_fee = self._taker_fee_pcts[get_market_slot(external_market, self.connectors)]
+        # Selling on the external market earns less than its price, buying there costs more
+        fee_adjustment = Decimal("1") - external_fee if pool_is_buy else Decimal("1") + external_fee
+        return CpmmPoolState(
+            base_reserve=reserves.base_reserve,
+            quote_reserve=reserves.quote_reserve,
+            fee=reserves.fee,
+            external_price=float(external_price * quote_rate * fee_adjustment),
+            pool_is_buy=pool_is_buy,
+            flat_fee=float(flat_fee),
+        )
+
+    @staticmethod
+    def _is_cpmm_market(market_info: MarketTradingPairTuple) -> bool:
+        return (isinstance(market_info.market, GatewayLp)
+                and get_connector_type(market_info.market.connector_name) == ConnectorType.AMM)
+
+    def _refresh_price(self, market_info: MarketTradingPairTuple) -> Tuple[Decimal, Decimal]:
+        """
+        Reads the best bid and ask from the market's order book and records them in the price cache. Connectors
+        without an order book (e.g. AMMs) have no top of book, NaN is recorded for them instead.
+        """
+        if isinstance(market_info.market, ExchangeBase):
+            prices = (market_info.get_price_by_type(PriceType.BestBid), market_info.get_price_by_type(PriceType.BestAsk))
+        else:
+            prices = (s_decimal_nan, s_decimal_nan)
+        self._price_cache[(market_info.market.name, market_info.trading_pair)] = prices
+        return prices
+
+    def _subscribe_to_order_book_trade_events(self):
+        """
+        Listens to public trades on the order books of the traded pairs so the price cache is refreshed as the books
+        move. Order books only become available once the connectors are ready, so this is retried until it succeeds.
+        """
+        for market_info in self.connectors.values():
+            if isinstance(market_info.market, ExchangeBase):
+                order_book = market_info.market.order_books.get(market_info.trading_pair)
+                if order_book is None:
+                    return
+        for market_info in self.connectors.values():
+            if isinstance(market_info.market, ExchangeBase):
+                order_book = market_info.market.order_books[market_info.trading_pair]
+                order_book.add_listener(OrderBookEvent.TradeEvent, self._order_book_trade_forwarder)
+                self._trade_event_order_books.append((order_book, market_info))
+        self._subscribed_to_order_book_trade_events = True
+
+    def _unsubscribe_from_order_book_trade_events(self):
+        for order_book, _ in self._trade_event_order_books:
+            order_book.remove_listener(OrderBookEvent.TradeEvent, self._order_book_trade_forwarder)
+        self._trade_event_order_books.clear()
+        self._subscribed_to_order_book_trade_events = False
+
+    def _process_public_trade(self, event_tag: int, order_book: PubSub, event: OrderBookTradeEvent):
+        # Matched on the order book itself, the same trading pair can be listed on both markets
+        for subscribed_order_book, market_info in self._trade_event_order_books:
+            if subscribed_order_book is order_book:
+                self._refresh_price(market_info)
+
+    def on_stop(self):
+        self._unsubscribe_from_order_book_trade_events()
+
+    async def _eval_size(self,
+                         amount: int,
+                         buy_market: MarketTradingPairTuple,
+                         sell_market: MarketTradingPairTuple,
+                         evaluations: Dict[int, Tuple[Optional[ArbProposal], Decimal]]) -> float:
+        """
+        Returns the fee-adjusted profitability of buying on buy_market and selling on sell_market for the given
+        order amount, expressed in ORDER_AMOUNT_QUANTUM units. Results are recorded in evaluations so that probes
+        repeated within the same search are not re-quoted.
+        """
+        if amount not in evaluations:
+            order_amount = Decimal(amount).scaleb(-ORDER_AMOUNT_DECIMALS)
+            evaluations[amount] = await self._cached_evaluation(buy_market, sell_market, order_amount)
+        return float(evaluations[amount][1])
+
+    async def _cached_evaluation(self,
+                                 buy_market: MarketTradingPairTuple,
+                                 sell_market: MarketTradingPairTuple,
+                                 order_amount: Decimal) -> Tuple[Optional[ArbProposal], Decimal]:
+        """
+        Returns the arbitrage proposal for the given markets and order amount along with its fee-adjusted
+        profitability, reusing quotes fetched less than proposal_cache_ttl_ms ago. The profitability is computed
+        once per quote and cached with it, since it is Decimal-heavy and consumed again by callers.
+        """
+        key = ProposalCache.key(buy_market, sell_market, order_amount)
+        now = self.market_data_provider.time()
+        cached = self._proposal_cache.get(key, now)
+        if cached is not None:
+            return cached
+
+        async with self._probe_semaphore:
             proposals = await create_arb_proposals(
                 market_info_1=buy_market,
                 market_info_2=sell_market,
+                market_1_extra_flat_fees=self._extra_flat_fees(buy_market),
+                market_2_extra_flat_fees=self._extra_flat_fees(sell_market),
                 order_amount=order_amount,
             )
-            
-            # create_arb_proposals returns two proposals, we only care about one direction
-            proposal = proposals[0] # The one that buys on market_info_1 and sells on market_info_2
+        # create_arb_proposals returns the direction buying on market_info_1 first, but skips any direction it could not
+        # quote, so the first proposal may be the reverse trade
+        if proposals and proposals[0].first_side.is_buy:
+            proposal = proposals[0]
             profit_pct = proposal.profit_pct(account_for_fee=True)
+        else:
+            proposal, profit_pct = None, s_decimal_neg_one
+        self._proposal_cache.put(key, now, proposal, profit_pct)
+        return proposal, profit_pct
 
-            if profit_pct > best_profit_pct:
-                best_profit_pct = profit_pct
-                best_proposal = proposal
-
-        if best_proposal and best_profit_pct > 0:
-            return best_proposal, best_profit_pct
-        return None
+    @staticmethod
+    def _extra_flat_fees(market_info: MarketTradingPairTuple) -> List[TokenAmount]:
+        """
+        Returns the flat fees charged on top of the order by the market, i.e. the network fee of Gateway connectors.
+        """
+        network_fee = getattr(market_info.market, "network_transaction_fee", None)
+        # Gateway connectors only know their network fee once the gas estimate has been fetched
+        return [network_fee] if network_fee is not None else []
 
     def create_executors(self, proposal: ArbProposal) -> List[ExecutorInfo]:
         """
         Creates executors for each side of the arbitrage.
         """
-        executors = []
-        for side in [proposal.first_side, proposal.second_side]:
-            order_candidate = self.create_order_candidate(side)
-            executors.append(ExecutorInfo(
-                controller_id=self.config.id,
+        controller_id = self.config.id
+        return [
+            ExecutorInfo(
+                controller_id=controller_id,
                 executor_name="dca_simple",  # Example executor
                 config={
-                    "order_candidate": order_candidate,
+                    "order_candidate": self.create_order_candidate(side),
                 }
-            ))
-        return executors
+            )
+            for side in (proposal.first_side, proposal.second_side)
+        ]
 
     def create_order_candidate(self, side: ArbProposalSide) -> OrderCandidate:
         """
         Creates an order candidate from an arbitrage proposal side, applying slippage buffer.
         """
-        slippage_buffer = self.get_slippage_buffer(side)
-        price_adjustment = Decimal("1") + (slippage_buffer if side.is_buy else -slippage_buffer)
-        
+        adjustments = self._buy_price_adjustments if side.is_buy else self._sell_price_adjustments
         # Use the price from the proposal, which already accounts for slippage from size
-        price = side.order_price * price_adjustment
+        price = side.order_price * adjustments[get_market_slot(side.market_info, self.connectors)]
 
         return OrderCandidate(
             trading_pair=side.market_info.trading_pair,
@@ -128,35 +475,40 @@ class AmmArbV2Controller(BaseController):
         )
 
     def get_slippage_buffer(self, side: ArbProposalSide) -> Decimal:
-        if side.market_info.market.name == self.config.connector_1:
-            return self.config.market_1_slippage_buffer
-        return self.config.market_2_slippage_buffer
+        return self._slippage_buffers[get_market_slot(side.market_info, self.connectors)]
 
     def on_buy_order_completed(self, event: BuyOrderCompletedEvent):
         self.log_with_clock(f"Buy order completed: {event}")
+        self._invalidate_search_results()
 
     def on_sell_order_completed(self, event: SellOrderCompletedEvent):
         self.log_with_clock(f"Sell order completed: {event}")
+        self._invalidate_search_results()
 
-    def get_markets_df(self) -> pd.DataFrame:
+    def get_markets_table(self) -> str:
         """
-        Returns a DataFrame with market information.
+        Returns a formatted table with market information. Built with tabulate directly since a DataFrame is
+        needless overhead for a couple of rows rendered on every status print. Prices are read from the price cache
+        and only pulled from the connector when a market has not been cached yet.
         """
-        data = []
+        names, buy_prices, sell_prices = [], [], []
         for market_name, market_info in self.connectors.items():
-            market = market_info.market
-            trading_pair = market_info.trading_pair
-            buy_price = market.get_price_by_type(trading_pair, OrderType.TAKER)
-            sell_price = market.get_price_by_type(trading_pair, OrderType.MAKER)
-            mid_price = (buy_price + sell_price) / 2
-            data.append([
-                market.display_name,
-                trading_pair,
-                sell_price,
-                buy_price,
-                mid_price,
-            ])
-        return pd.DataFrame(data=data, columns=["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"])
+            prices = self._price_cache.get((market_info.market.name, market_info.trading_pair))
+            if prices is None:
+                prices = self._refresh_price(market_info)
+            best_bid, best_ask = prices
+            names.append((market_info.market.display_name, market_info.trading_pair))
+            buy_prices.append(best_ask)
+            sell_prices.append(best_bid)
+
+        # Mid prices are display-only, so compute them for all markets at once in float64
+        mid_prices = (np.array(buy_prices, dtype=np.float64) + np.array(sell_prices, dtype=np.float64)) * 0.5
+        rows = [
+            [display_name, trading_pair, sell_price, buy_price, mid_price]
+            for (display_name, trading_pair), sell_price, buy_price, mid_price
+            in zip(names, sell_prices, buy_prices, mid_prices)
+        ]
+        return tabulate(rows, headers=["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"], tablefmt="psql")
 
     def get_assets_df(self) -> pd.DataFrame:
         """
@@ -164,23 +516,28 @@ class AmmArbV2Controller(BaseController):
         """
         return self.balance_df()
 
-    def get_active_orders_df(self) -> pd.DataFrame:
+    def get_active_orders_table(self) -> str:
         """
-        Returns a DataFrame with active orders.
+        Returns a formatted table with active orders.
         """
-        data = []
-        for order in self.active_orders:
-            data.append([
-                order.trading_pair,
-                order.trade_type.name,
-                order.amount,
-                order.price,
-            ])
-        return pd.DataFrame(data=data, columns=["Market", "Side", "Amount", "Price"])
+        rows = [
+            [order.trading_pair, order.trade_type.name, order.amount, order.price]
+            for order in self.active_orders
+        ]
+        return tabulate(rows, headers=["Market", "Side", "Amount", "Price"], tablefmt="psql")
 
-    def get_profitability_msg(self, proposal: ArbProposal) -> List[str]:
+    def get_status_signature(self) -> Tuple:
         """
-        Returns a message with the profitability of the last evaluated proposal.
+        Returns a cheap signature of the state rendered in the strategy status: the last proposal, the number of
+        active orders and the cached market prices. The status only needs to be rebuilt when it changes.
         """
-        profit_pct = proposal.profit_pct(account_for_fee=True)
+        return id(self.last_proposal), self.last_profit_pct, len(self.active_orders), tuple(self._price_cache.items())
+
+    def get_profitability_msg(self, proposal: ArbProposal, profit_pct: Optional[Decimal] = None) -> List[str]:
+        """
+        Returns a message with the profitability of the last evaluated proposal. The profitability computed during
+        the search can be passed in to avoid recomputing it.
+        """
+        if profit_pct is None:
+            profit_pct = proposal.profit_pct(account_for_fee=True)
         return [f"  - Last Optimal Proposal: Size {proposal.first_side.amount:.6f}, Profitability: {profit_pct:.2%}"]
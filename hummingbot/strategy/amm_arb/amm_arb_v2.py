@@ -1,11 +1,14 @@
-from decimal import Decimal
+from typing import Optional, Tuple
 
-from hummingbot.client.ui.interface_utils import format_df_for_printing
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.strategy.amm_arb.amm_arb_config import AmmArbV2Config
 from hummingbot.strategy.amm_arb.amm_arb_controller import AmmArbV2Controller
 from hummingbot.strategy.v2.controllers_factory import ControllersFactory
 from hummingbot.strategy.v2.strategy_v2_base import StrategyV2Base
 
+# Balances are not part of the status signature, so a cached status is rebuilt at least this often (in seconds)
+STATUS_CACHE_MAX_AGE = 10.0
+
 
 class AmmArbV2(StrategyV2Base):
     """
@@ -16,33 +19,45 @@ class AmmArbV2(StrategyV2Base):
     def __init__(self, config: AmmArbV2Config, controllers_factory: ControllersFactory):
         super().__init__(config, controllers_factory)
         self.config = config
+        # (timestamp, controller status signature, rendered status) of the last status render
+        self._status_cache: Tuple[float, Optional[Tuple], str] = (0.0, None, "")
 
     def format_status(self) -> str:
         if not self.is_ready():
             return "Strategy not ready yet."
 
         controller: AmmArbV2Controller = self.controllers["main"]
-        markets_df = controller.get_markets_df()
-        assets_df = controller.get_assets_df()
-
-        lines = ["\n# Markets"]
-        lines.extend(["", "  " + line for line in format_df_for_printing(markets_df).split("\n")])
+        signature = controller.get_status_signature()
+        rendered_at, cached_signature, cached_status = self._status_cache
+        if signature == cached_signature and self.current_timestamp - rendered_at < STATUS_CACHE_MAX_AGE:
+            return cached_status
 
-        lines.extend(["\n# Assets"])
-        lines.extend(["", "  " + line for line in format_df_for_printing(assets_df).split("\n")])
-
-        lines.extend(["\n# Active Orders"])
+        assets_df = controller.get_assets_df()
+        sections = [
+            "\n# Markets",
+            "",
+            self._indent(controller.get_markets_table()),
+            "\n# Assets",
+            "",
+            self._indent(format_df_for_printout(assets_df, table_format="psql")),
+            "\n# Active Orders",
+        ]
         if len(controller.active_orders) > 0:
-            active_orders_df = controller.get_active_orders_df()
-            lines.extend(["", "  " + line for line in format_df_for_printing(active_orders_df).split("\n")])
+            sections.extend(["", self._indent(controller.get_active_orders_table())])
         else:
-            lines.append("  No active orders.")
+            sections.append("  No active orders.")
 
-        lines.extend(["\n# Profitability"])
+        sections.append("\n# Profitability")
         if controller.last_proposal:
-            profitability_msg = controller.get_profitability_msg(controller.last_proposal)
-            lines.extend(["", "  " + line for line in profitability_msg])
+            profitability_msg = controller.get_profitability_msg(controller.last_proposal, controller.last_profit_pct)
+            sections.extend(["", self._indent("\n".join(profitability_msg))])
         else:
-            lines.append("  No arbitrage opportunities found yet.")
+            sections.append("  No arbitrage opportunities found yet.")
+
+        status = "\n".join(sections)
+        self._status_cache = (self.current_timestamp, signature, status)
+        return status
 
-        return "\n".join(lines)
+    @staticmethod
+    def _indent(text: str) -> str:
+        return "\n".join(f"  {line}" for line in text.split("\n"))
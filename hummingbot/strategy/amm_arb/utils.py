@@ -1,13 +1,22 @@
 from decimal import Decimal
 from enum import Enum
-from typing import List
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
+
+from hummingbot.connector.gateway.gateway_lp import AMMPoolInfo
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
 from .data_types import ArbProposal, ArbProposalSide, TokenAmount
 
 s_decimal_nan = Decimal("NaN")
+PROPOSAL_CACHE_EVICTION_FACTOR = 5
+GOLDEN_RATIO_CONJUGATE = (5 ** 0.5 - 1) / 2
+GOLDEN_SECTION_MAX_ITERATIONS = 10
+BRACKET_GRID_STEPS = 5
+
+ProposalCacheKey = Tuple[str, str, str, str, Decimal]
 
 
 class TradeDirection(Enum):
@@ -15,6 +24,32 @@ class TradeDirection(Enum):
     SELL = 0
 
 
+class CpmmReserves(NamedTuple):
+    """
+    The reserves of a constant product pool in the token order of the traded pair, with the pool fee as a fraction.
+    """
+    base_reserve: float
+    quote_reserve: float
+    fee: float
+
+    @property
+    def spot_price(self) -> Decimal:
+        return Decimal(str(self.quote_reserve / self.base_reserve)) if self.base_reserve > 0 else s_decimal_nan
+
+
+class CpmmPoolState(NamedTuple):
+    """
+    A constant product pool arbitraged against an external market. Prices and the flat fees are expressed in the
+    pool's quote asset, the external price is net of the external market's taker fee.
+    """
+    base_reserve: float
+    quote_reserve: float
+    fee: float
+    external_price: float
+    pool_is_buy: bool
+    flat_fee: float = 0.0
+
+
 async def create_arb_proposals(
         market_info_1: MarketTradingPairTuple,
         market_info_2: MarketTradingPairTuple,
@@ -64,3 +99,182 @@ async def create_arb_proposals(
         results.append(ArbProposal(first_side, second_side))
 
     return results
+
+
+async def bracket_maximum(evaluate: Callable[[int], Awaitable[float]],
+                          lower: int,
+                          upper: int,
+                          steps: int = BRACKET_GRID_STEPS) -> Tuple[int, int]:
+    """
+    Evaluates a grid of steps points over [lower, upper], both ends included, concurrently and returns the neighbours
+    of the best point as a bracket of the maximum. The bracket is returned even when no point evaluates above 0, since
+    a narrow profitable region can sit between two grid points.
+    """
+    step_size = (upper - lower) // (steps - 1)
+    grid = [lower + i * step_size for i in range(steps - 1)] + [upper]
+    values = await safe_gather(*[evaluate(point) for point in grid])
+    best_index = max(range(steps), key=lambda i: values[i])
+    return grid[max(best_index - 1, 0)], grid[min(best_index + 1, steps - 1)]
+
+
+async def golden_section_search(evaluate: Callable[[int], Awaitable[float]],
+                                lower: int,
+                                upper: int,
+                                max_iterations: int = GOLDEN_SECTION_MAX_ITERATIONS) -> int:
+    """
+    Searches the integer range [lower, upper] for the maximum of a unimodal function and returns the best point
+    evaluated. Each iteration discards the part of the range beyond the worse of the two inner points, reusing the
+    other one, so only one new evaluation is needed per iteration.
+    """
+    inner_low = upper - int(GOLDEN_RATIO_CONJUGATE * (upper - lower))
+    inner_high = lower + int(GOLDEN_RATIO_CONJUGATE * (upper - lower))
+    value_low = await evaluate(inner_low)
+    value_high = await evaluate(inner_high)
+    best_value, best_point = max((value_low, inner_low), (value_high, inner_high))
+
+    for _ in range(max_iterations):
+        if upper - lower <= 1:
+            break
+        if value_low > value_high:
+            # The maximum lies in [lower, inner_high]; the old inner_low becomes the new inner_high
+            upper, inner_high, value_high = inner_high, inner_low, value_low
+            inner_low = upper - int(GOLDEN_RATIO_CONJUGATE * (upper - lower))
+            value_low = await evaluate(inner_low)
+            best_value, best_point = max((best_value, best_point), (value_low, inner_low))
+        else:
+            # The maximum lies in [inner_low, upper]; the old inner_high becomes the new inner_low
+            lower, inner_low, value_low = inner_low, inner_high, value_high
+            inner_high = lower + int(GOLDEN_RATIO_CONJUGATE * (upper - lower))
+            value_high = await evaluate(inner_high)
+            best_value, best_point = max((best_value, best_point), (value_high, inner_high))
+    return best_point
+
+
+def orient_pool_reserves(pool_info: AMMPoolInfo,
+                         pool_base_token: Optional[str],
+                         pool_quote_token: Optional[str],
+                         base_asset: str,
+                         quote_asset: str) -> Optional[CpmmReserves]:
+    """
+    Returns the pool reserves ordered as the traded pair (base_asset, quote_asset). Gateway reports them in the pool's
+    own token order, which can be the reverse of the pair. Returns None when the pool tokens, given as symbols, do not
+    match the pair, e.g. when they could not be resolved.
+    """
+    pool_tokens = ((pool_base_token or "").upper(), (pool_quote_token or "").upper())
+    pair_tokens = (base_asset.upper(), quote_asset.upper())
+    fee = pool_info.fee_pct / 100
+    if pool_tokens == pair_tokens:
+        return CpmmReserves(pool_info.base_token_amount, pool_info.quote_token_amount, fee)
+    if pool_tokens == pair_tokens[::-1]:
+        return CpmmReserves(pool_info.quote_token_amount, pool_info.base_token_amount, fee)
+    return None
+
+
+def cpmm_optimal_size(pool: CpmmPoolState) -> Optional[float]:
+    """
+    Returns the size that maximizes the absolute arbitrage profit against a constant product pool, where the pool's
+    marginal price reaches the external price. With base reserve x, quote reserve y, pool fee f and external price p:
+    - buying on the pool: x - sqrt(x * y / (p * (1 - f)))
+    - selling on the pool: (sqrt(x * y * (1 - f) / p) - x) / (1 - f)
+    Past this size every extra unit loses money, so the profitability is also decreasing beyond it.
+    Returns None when the pool price already crossed the external price, i.e. when no size is profitable.
+    """
+    fee_factor = 1.0 - pool.fee
+    if pool.pool_is_buy:
+        optimal_size = pool.base_reserve - (pool.base_reserve * pool.quote_reserve
+                                            / (pool.external_price * fee_factor)) ** 0.5
+    else:
+        optimal_size = ((pool.base_reserve * pool.quote_reserve * fee_factor / pool.external_price) ** 0.5
+                        - pool.base_reserve) / fee_factor
+    return optimal_size if optimal_size > 0 else None
+
+
+def estimate_cpmm_profits(pool: CpmmPoolState, sizes: np.ndarray) -> np.ndarray:
+    """
+    Estimates the profitability of arbitraging each size between a constant product pool (base reserve x, quote
+    reserve y, fee f) and an external market at a fixed price p, paying the flat fees F on top:
+    - buying size d on the pool costs y * d / ((x - d) * (1 - f)) + F and selling it externally earns p * d
+    - buying size d externally costs p * d + F and selling it on the pool earns y * d * (1 - f) / (x + d * (1 - f))
+    Sizes the pool cannot fill (buying its whole base reserve or more) are estimated at -inf.
+    """
+    fee_factor = 1.0 - pool.fee
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if pool.pool_is_buy:
+            cost = pool.quote_reserve * sizes / ((pool.base_reserve - sizes) * fee_factor) + pool.flat_fee
+            revenue = pool.external_price * sizes
+        else:
+            cost = pool.external_price * sizes + pool.flat_fee
+            revenue = pool.quote_reserve * sizes * fee_factor / (pool.base_reserve + sizes * fee_factor)
+        profits = (revenue - cost) / cost
+    fillable = (sizes > 0) & (sizes < pool.base_reserve) if pool.pool_is_buy else sizes > 0
+    return np.where(fillable & np.isfinite(profits), profits, -np.inf)
+
+
+def spread_covers_fees(buy_price: Decimal,
+                       sell_price: Decimal,
+                       quote_rate: Optional[Decimal],
+                       fee_pct: Decimal,
+                       min_profitability: Decimal) -> bool:
+    """
+    Returns False when the spread between buying at buy_price and selling at sell_price, converted to the buy quote
+    asset with quote_rate, cannot cover fee_pct plus min_profitability. Price impact only narrows the spread as the
+    order amount grows, so no size can be profitable in that case. Returns True whenever the spread cannot be
+    determined, so that a search is never skipped for lack of a price.
+    """
+    if not buy_price or not sell_price or not quote_rate or buy_price.is_nan() or sell_price.is_nan():
+        return True
+    spread_pct = (sell_price * quote_rate - buy_price) / buy_price
+    return spread_pct >= min_profitability + fee_pct
+
+
+def get_market_slot(market_info: MarketTradingPairTuple, markets: Dict[str, MarketTradingPairTuple]) -> str:
+    """
+    Returns the config slot ("market_1" or "market_2") the given market trades in. The live connector name cannot be
+    used for this since Gateway and paper trade connectors are renamed from the configured one. Like the v1 strategy,
+    anything that is not market_1 is treated as market_2.
+    """
+    return "market_1" if market_info == markets.get("market_1") else "market_2"
+
+
+class ProposalCache:
+    """
+    A time-to-live cache of arbitrage proposals along with their fee-adjusted profitability, keyed on the buy and
+    sell markets, their trading pairs and the order amount. Entries are served while younger than the TTL and only
+    dropped once they are eviction_factor times older, so that the cache stays bounded.
+    """
+
+    def __init__(self, ttl: float, eviction_factor: int = PROPOSAL_CACHE_EVICTION_FACTOR):
+        self._ttl = ttl
+        self._eviction_factor = eviction_factor
+        self._entries: Dict[ProposalCacheKey, Tuple[float, Optional[ArbProposal], Decimal]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(buy_market: MarketTradingPairTuple,
+            sell_market: MarketTradingPairTuple,
+            order_amount: Decimal) -> ProposalCacheKey:
+        return (
+            buy_market.market.name,
+            buy_market.trading_pair,
+            sell_market.market.name,
+            sell_market.trading_pair,
+            order_amount,
+        )
+
+    def get(self, key: ProposalCacheKey, now: float) -> Optional[Tuple[Optional[ArbProposal], Decimal]]:
+        entry = self._entries.get(key)
+        if entry is None or now - entry[0] >= self._ttl:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, key: ProposalCacheKey, now: float, proposal: Optional[ArbProposal], profit_pct: Decimal):
+        self._entries[key] = (now, proposal, profit_pct)
+
+    def evict_stale(self, now: float):
+        max_age = self._eviction_factor * self._ttl
+        self._entries = {key: entry for key, entry in self._entries.items() if now - entry[0] < max_age}
+
+    def clear(self):
+        self._entries.clear()
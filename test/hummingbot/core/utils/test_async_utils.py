@@ -0,0 +1,22 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.utils import async_utils
+
+
+class InstallEventLoopPolicyUnitTest(unittest.TestCase):
+
+    @patch("hummingbot.core.utils.async_utils.asyncio.set_event_loop_policy")
+    def test_uvloop_policy_is_installed_when_available(self, set_policy_mock: MagicMock):
+        uvloop_mock = MagicMock()
+        with patch.object(async_utils, "uvloop", uvloop_mock):
+            async_utils.install_event_loop_policy()
+
+        set_policy_mock.assert_called_once_with(uvloop_mock.EventLoopPolicy.return_value)
+
+    @patch("hummingbot.core.utils.async_utils.asyncio.set_event_loop_policy")
+    def test_default_policy_is_kept_without_uvloop(self, set_policy_mock: MagicMock):
+        with patch.object(async_utils, "uvloop", None):
+            async_utils.install_event_loop_policy()
+
+        set_policy_mock.assert_not_called()
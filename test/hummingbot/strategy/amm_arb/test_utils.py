@@ -2,7 +2,10 @@ import asyncio
 import unittest
 from decimal import Decimal
 
+import numpy as np
+
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.gateway.gateway_lp import AMMPoolInfo
 from hummingbot.strategy.amm_arb import utils
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
@@ -59,3 +62,256 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+
+class ProposalCacheUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.market_1 = MockConnector1()
+        self.market_2 = MockConnector2()
+        self.market_info1 = MarketTradingPairTuple(self.market_1, trading_pair, base, quote)
+        self.market_info2 = MarketTradingPairTuple(self.market_2, trading_pair, base, quote)
+        self.cache = utils.ProposalCache(ttl=0.5)
+
+    def test_key_includes_markets_trading_pairs_and_amount(self):
+        key = utils.ProposalCache.key(self.market_info1, self.market_info2, Decimal("1"))
+        self.assertEqual(
+            (self.market_1.name, trading_pair, self.market_2.name, trading_pair, Decimal("1")),
+            key
+        )
+
+    def test_key_distinguishes_directions_on_a_shared_connector(self):
+        other_pair_info = MarketTradingPairTuple(self.market_1, "HBOT-DAI", base, "DAI")
+        self.assertNotEqual(
+            utils.ProposalCache.key(self.market_info1, other_pair_info, Decimal("1")),
+            utils.ProposalCache.key(other_pair_info, self.market_info1, Decimal("1"))
+        )
+
+    def test_entry_is_served_within_ttl(self):
+        key = utils.ProposalCache.key(self.market_info1, self.market_info2, Decimal("1"))
+        self.cache.put(key, 100, None, Decimal("0.01"))
+
+        self.assertEqual((None, Decimal("0.01")), self.cache.get(key, 100.4))
+        self.assertIsNone(self.cache.get(key, 100.5))
+
+    def test_evict_stale_drops_entries_past_eviction_age(self):
+        key_1 = utils.ProposalCache.key(self.market_info1, self.market_info2, Decimal("1"))
+        key_2 = utils.ProposalCache.key(self.market_info1, self.market_info2, Decimal("2"))
+        self.cache.put(key_1, 100, None, Decimal("0.01"))
+        self.cache.put(key_2, 102, None, Decimal("0.02"))
+
+        self.cache.evict_stale(102.5)
+
+        self.assertEqual(1, len(self.cache))
+        self.assertIsNone(self.cache.get(key_1, 102.5))
+
+    def test_clear(self):
+        key = utils.ProposalCache.key(self.market_info1, self.market_info2, Decimal("1"))
+        self.cache.put(key, 100, None, Decimal("0.01"))
+
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+
+
+class GetMarketSlotUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.market_info1 = MarketTradingPairTuple(MockConnector1(), trading_pair, base, quote)
+        self.market_info2 = MarketTradingPairTuple(MockConnector2(), trading_pair, base, quote)
+        self.markets = {"market_1": self.market_info1, "market_2": self.market_info2}
+
+    def test_slot_is_matched_on_the_market_not_its_name(self):
+        self.assertEqual("market_1", utils.get_market_slot(self.market_info1, self.markets))
+        self.assertEqual("market_2", utils.get_market_slot(self.market_info2, self.markets))
+
+    def test_slot_of_a_shared_connector_is_told_apart_by_trading_pair(self):
+        other_pair_info = MarketTradingPairTuple(self.market_info1.market, "HBOT-DAI", base, "DAI")
+        markets = {"market_1": self.market_info1, "market_2": other_pair_info}
+
+        self.assertEqual("market_1", utils.get_market_slot(self.market_info1, markets))
+        self.assertEqual("market_2", utils.get_market_slot(other_pair_info, markets))
+
+    def test_unknown_market_defaults_to_market_2(self):
+        unknown_info = MarketTradingPairTuple(MockConnector1(), trading_pair, base, quote)
+
+        self.assertEqual("market_2", utils.get_market_slot(unknown_info, self.markets))
+
+
+class SizeSearchUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.evaluated = []
+
+    def async_run_with_timeout(self, coroutine, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def unimodal(self, optimum: int):
+        async def evaluate(amount: int) -> float:
+            self.evaluated.append(amount)
+            return 1 - ((amount - optimum) / 1000) ** 2
+        return evaluate
+
+    def test_bracket_maximum_returns_neighbours_of_best_grid_point(self):
+        bracket = self.async_run_with_timeout(utils.bracket_maximum(self.unimodal(7700), 0, 10000))
+
+        self.assertEqual((5000, 10000), bracket)
+        self.assertEqual([0, 2500, 5000, 7500, 10000], self.evaluated)
+
+    def test_bracket_maximum_clips_bracket_at_range_end(self):
+        bracket = self.async_run_with_timeout(utils.bracket_maximum(self.unimodal(0), 0, 10000))
+
+        self.assertEqual((0, 2500), bracket)
+
+    def test_narrow_profitable_region_between_grid_points_is_found(self):
+        # Only sizes within 100 of 3100 are profitable, every grid point is 2500 apart and loses money
+        async def evaluate(amount: int) -> float:
+            self.evaluated.append(amount)
+            return 0.01 - ((amount - 3100) / 1000) ** 2
+
+        lower, upper = self.async_run_with_timeout(utils.bracket_maximum(evaluate, 0, 10000))
+        best = self.async_run_with_timeout(utils.golden_section_search(evaluate, lower, upper))
+
+        self.assertTrue(all(self.async_run_with_timeout(evaluate(point)) < 0 for point in (0, 2500, 5000)))
+        self.assertEqual((0, 5000), (lower, upper))
+        self.assertGreater(self.async_run_with_timeout(evaluate(best)), 0)
+
+    def test_golden_section_search_finds_maximum(self):
+        best = self.async_run_with_timeout(utils.golden_section_search(self.unimodal(7700), 5000, 10000))
+
+        self.assertAlmostEqual(7700, best, delta=10)
+        self.assertEqual(utils.GOLDEN_SECTION_MAX_ITERATIONS + 2, len(self.evaluated))
+
+    def test_golden_section_search_stops_on_exhausted_range(self):
+        best = self.async_run_with_timeout(utils.golden_section_search(self.unimodal(3), 0, 4))
+
+        self.assertEqual(3, best)
+        self.assertLess(len(self.evaluated), utils.GOLDEN_SECTION_MAX_ITERATIONS + 2)
+
+
+class CpmmEstimateUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        # 100 base for 300000 quote, a 3000 pool price against a 3100 external price
+        self.buy_pool = utils.CpmmPoolState(
+            base_reserve=100.0,
+            quote_reserve=300000.0,
+            fee=0.003,
+            external_price=3100.0,
+            pool_is_buy=True,
+            flat_fee=5.0,
+        )
+        self.sell_pool = self.buy_pool._replace(external_price=2900.0, pool_is_buy=False)
+
+    def test_optimal_size_is_where_pool_price_meets_external_price(self):
+        for pool in (self.buy_pool, self.sell_pool):
+            size = utils.cpmm_optimal_size(pool)
+            fee_factor = 1 - pool.fee
+            if pool.pool_is_buy:
+                marginal_price = pool.quote_reserve * pool.base_reserve / ((pool.base_reserve - size) ** 2 * fee_factor)
+            else:
+                marginal_price = (pool.quote_reserve * pool.base_reserve * fee_factor
+                                  / (pool.base_reserve + size * fee_factor) ** 2)
+            self.assertAlmostEqual(pool.external_price, marginal_price, places=6)
+
+    def test_optimal_size_is_none_when_pool_price_crossed_external_price(self):
+        self.assertIsNone(utils.cpmm_optimal_size(self.buy_pool._replace(external_price=2900.0)))
+        self.assertIsNone(utils.cpmm_optimal_size(self.sell_pool._replace(external_price=3100.0)))
+
+    def test_estimate_matches_profitability_of_a_single_size(self):
+        profits = utils.estimate_cpmm_profits(self.buy_pool, np.array([1.0]))
+
+        cost = 300000.0 * 1.0 / ((100.0 - 1.0) * 0.997) + 5.0
+        self.assertAlmostEqual((3100.0 - cost) / cost, profits[0])
+
+    def test_flat_fee_gives_an_interior_optimum(self):
+        for pool in (self.buy_pool, self.sell_pool):
+            sizes = np.linspace(0.01, utils.cpmm_optimal_size(pool), 64)
+            profits = utils.estimate_cpmm_profits(pool, sizes)
+            best_index = int(np.argmax(profits))
+
+            self.assertGreater(profits[best_index], 0)
+            self.assertGreater(best_index, 0)
+            self.assertLess(best_index, len(sizes) - 1)
+
+    def test_unfillable_sizes_are_estimated_at_minus_infinity(self):
+        profits = utils.estimate_cpmm_profits(self.buy_pool, np.array([0.0, 100.0, 150.0]))
+
+        self.assertTrue(np.all(np.isneginf(profits)))
+
+
+class OrientPoolReservesUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool_info = AMMPoolInfo(
+            address="0xPool",
+            baseTokenAddress="0xHbot",
+            quoteTokenAddress="0xUsdt",
+            price=3.0,
+            feePct=0.3,
+            baseTokenAmount=100.0,
+            quoteTokenAmount=300.0,
+        )
+
+    def test_reserves_in_pair_order_are_kept(self):
+        reserves = utils.orient_pool_reserves(self.pool_info, base, quote, base, quote)
+
+        self.assertEqual(utils.CpmmReserves(100.0, 300.0, 0.003), reserves)
+
+    def test_reserves_in_reverse_order_are_swapped(self):
+        reserves = utils.orient_pool_reserves(self.pool_info, quote, base, base, quote)
+
+        self.assertEqual(utils.CpmmReserves(300.0, 100.0, 0.003), reserves)
+
+    def test_tokens_are_compared_case_insensitively(self):
+        reserves = utils.orient_pool_reserves(self.pool_info, base.lower(), quote.lower(), base, quote)
+
+        self.assertEqual(utils.CpmmReserves(100.0, 300.0, 0.003), reserves)
+
+    def test_unmatched_tokens_return_none(self):
+        self.assertIsNone(utils.orient_pool_reserves(self.pool_info, base, "DAI", base, quote))
+        self.assertIsNone(utils.orient_pool_reserves(self.pool_info, None, None, base, quote))
+
+
+class SpreadCoversFeesUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        # A CEX selling at 3010 against a pool quoting 3000, with 0.2% fees on each side
+        self.pool_reserves = utils.CpmmReserves(base_reserve=100.0, quote_reserve=300000.0, fee=0.003)
+        self.fee_pct = Decimal("0.004")
+
+    def test_pool_spot_price(self):
+        self.assertEqual(Decimal("3000.0"), self.pool_reserves.spot_price)
+        self.assertTrue(utils.CpmmReserves(0.0, 300000.0, 0.003).spot_price.is_nan())
+
+    def test_search_is_skipped_when_pool_spread_cannot_cover_fees(self):
+        self.assertFalse(utils.spread_covers_fees(
+            buy_price=self.pool_reserves.spot_price,
+            sell_price=Decimal("3010"),
+            quote_rate=Decimal("1"),
+            fee_pct=self.fee_pct,
+            min_profitability=Decimal("0.001"),
+        ))
+
+    def test_search_runs_when_pool_spread_covers_fees(self):
+        self.assertTrue(utils.spread_covers_fees(
+            buy_price=self.pool_reserves.spot_price,
+            sell_price=Decimal("3030"),
+            quote_rate=Decimal("1"),
+            fee_pct=self.fee_pct,
+            min_profitability=Decimal("0.001"),
+        ))
+
+    def test_search_runs_when_spread_cannot_be_determined(self):
+        self.assertTrue(utils.spread_covers_fees(
+            Decimal("NaN"), Decimal("3010"), Decimal("1"), self.fee_pct, Decimal("0.001")
+        ))
+        self.assertTrue(utils.spread_covers_fees(
+            self.pool_reserves.spot_price, Decimal("3010"), None, self.fee_pct, Decimal("0.001")
+        ))